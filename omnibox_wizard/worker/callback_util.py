@@ -87,7 +87,9 @@ class CallbackUtil:
 
     def _should_upload_to_s3(self, payload: dict) -> bool:
         """Check if payload should be uploaded to S3 based on size threshold"""
-        serialized = json.dumps(payload, ensure_ascii=False)
+        # Measure the body as it is actually sent: httpx's json= and the S3
+        # upload both serialize with compact separators.
+        serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
         return len(serialized.encode("utf-8")) > self.payload_size_threshold
 
     @tracer.start_as_current_span("CallbackUtil._request_presigned_url")
@@ -1,9 +1,11 @@
+import asyncio
 import os
 import tempfile
 from pathlib import Path
 
 import httpx
 from httpx import AsyncHTTPTransport, Timeout
+from pydantic import TypeAdapter
 
 from common.exception import CommonException
 from common.plain_reader import read_text_file
@@ -18,6 +20,7 @@ from omnibox_wizard.worker.functions.file_readers.office_reader import (
 )
 
 FILE_CONTENT_TOO_LONG_CODE = "FILE_CONTENT_TOO_LONG"
+IMAGE_LIST_ADAPTER: TypeAdapter[list[Image]] = TypeAdapter(list[Image])
 
 
 def format_content_too_long_message(
@@ -186,7 +189,11 @@ class FileReader(BaseFunction):
         include_screenshots: bool = task_input.get("include_screenshots", True)
         include_links: bool = task_input.get("include_links", False)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Clean up the temp dir off the event loop: large uploads can leave
+        # sizeable files behind and removing them would block other tasks.
+        temp_dir_handle = tempfile.TemporaryDirectory()
+        temp_dir: str = temp_dir_handle.name
+        try:
             local_path: str = os.path.join(temp_dir, filename)
             await self.download(task.namespace_id, resource_id, local_path)
 
@@ -214,15 +221,17 @@ class FileReader(BaseFunction):
                     "markdown": f"`{e.error}`",
                     "skip_tasks": True,
                 }
+        finally:
+            await asyncio.to_thread(temp_dir_handle.cleanup)
 
         result_dict: dict = {
             "title": (metadata or {}).pop("title", None) or title,
             "markdown": markdown,
         }
         if images:
-            result_dict["images"] = [
-                image.model_dump(exclude_none=True) for image in images
-            ]
+            result_dict["images"] = IMAGE_LIST_ADAPTER.dump_python(
+                images, exclude_none=True
+            )
         if metadata:
             result_dict["metadata"] = metadata
 
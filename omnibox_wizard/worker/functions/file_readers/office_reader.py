@@ -1,4 +1,3 @@
-import io
 import re
 from pathlib import Path
 
@@ -22,22 +21,22 @@ class OfficeReader(httpx.AsyncClient):
     async def convert(
         self, file_path: str, ext: str | None = None, mimetype: str | None = None
     ) -> tuple[str, list[Image]]:
-        with open(file_path, "rb") as f:
-            bytes_content: bytes = f.read()
-
         ext = ext or Path(file_path).suffix.lower()
         mimetype = mimetype or guess_mimetype(file_path)
 
-        response: httpx.Response = await self.post(
-            "/v1/convert/file",
-            data={
-                "from_formats": [ext.lstrip(".")],
-                "to_formats": ["md"],
-                "image_export_mode": "embedded",
-            },
-            files={"files": (file_path, io.BytesIO(bytes_content), mimetype)},
-            timeout=600,
-        )
+        # Hand httpx the open file so the multipart body is streamed in chunks
+        # instead of buffering the whole document in memory first.
+        with open(file_path, "rb") as f:
+            response: httpx.Response = await self.post(
+                "/v1/convert/file",
+                data={
+                    "from_formats": [ext.lstrip(".")],
+                    "to_formats": ["md"],
+                    "image_export_mode": "embedded",
+                },
+                files={"files": (file_path, f, mimetype)},
+                timeout=600,
+            )
         assert response.is_success, response.text
         json_response: dict = response.json()
         markdown: str = json_response["document"]["md_content"]
@@ -67,17 +66,16 @@ class OfficeOperatorClient(httpx.AsyncClient):
         dest_path: str | None = None,
         mimetype: str | None = None,
     ) -> str:
-        with open(src_path, "rb") as f:
-            bytes_content: bytes = f.read()
         src_ext = src_ext or Path(src_path).suffix.lower()
         dest_path = dest_path or src_path + "x"
         mimetype = mimetype or guess_mimetype(src_path)
 
-        response: httpx.Response = await self.post(
-            f"/api/v1/migrate/{src_ext.lstrip('.')}",
-            files={"file": (src_path, io.BytesIO(bytes_content), mimetype)},
-            data={"timeout": self.timeout.connect},
-        )
+        with open(src_path, "rb") as f:
+            response: httpx.Response = await self.post(
+                f"/api/v1/migrate/{src_ext.lstrip('.')}",
+                files={"file": (src_path, f, mimetype)},
+                data={"timeout": self.timeout.connect},
+            )
         assert response.is_success, response.text
         with open(dest_path, "wb") as f:
             f.write(response.content)
@@ -1,4 +1,5 @@
 import mimetypes
+from functools import lru_cache
 
 mimetype_mapping: dict[str, str] = {
     "text/x-markdown": ".md",
@@ -7,6 +8,7 @@ mimetype_mapping: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=64)
 def guess_extension(mimetype: str) -> str | None:
     if mime_ext := mimetype_mapping.get(mimetype, None):
         return mime_ext
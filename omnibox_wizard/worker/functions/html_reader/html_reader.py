@@ -273,7 +273,8 @@ class HTMLReaderV2(BaseFunction):
     @tracer.start_as_current_span("HTMLReaderV2.run")
     async def run(self, task: Task, trace_info: TraceInfo) -> dict:
         result_dict: dict = await self.main(task, trace_info)
-        if result_dict.get("markdown"):
+        if markdown := result_dict.get("markdown"):
+            title: str = result_dict.get("title", "")
             next_tasks: list[dict] = []
             user = task.payload.get("user", {}) if task.payload else {}
             user_options = user.get("options", {})
@@ -281,10 +282,7 @@ class HTMLReaderV2(BaseFunction):
             # Add extract_tags to next_tasks if enabled
             if user_options.get("enable_ai_tag_extraction", "true") == "true":
                 lang = get_lang_from_user_options(user_options)
-                extract_tags_input = {
-                    "title": result_dict.get("title", ""),
-                    "content": result_dict["markdown"],
-                }
+                extract_tags_input = {"title": title, "content": markdown}
                 if lang:
                     extract_tags_input["lang"] = lang
                 extract_tags_task = task.create_next_task(
@@ -295,10 +293,7 @@ class HTMLReaderV2(BaseFunction):
             # Add generate_title to next_tasks
             generate_title_task = task.create_next_task(
                 TaskFunction.GENERATE_TITLE,
-                {
-                    "title": result_dict.get("title", ""),
-                    "content": result_dict["markdown"],
-                },
+                {"title": title, "content": markdown},
             )
             next_tasks.append(generate_title_task.model_dump())
 
@@ -26,40 +26,46 @@ class HTMLReaderBaseProcessor(ABC):
     @classmethod
     async def img_selection_to_image(cls, image_selection) -> list[Image]:
         tuple_images: list[tuple[str, str]] = []
+        seen_srcs: set[str] = set()
 
         for img in image_selection:
-            if src := img.get("src"):
-                if not any(x[0] == src for x in tuple_images):
-                    tuple_images.append(
-                        (src, img.get("alt", cls.get_name_from_url(src)))
-                    )
+            if (src := img.get("src")) and src not in seen_srcs:
+                seen_srcs.add(src)
+                tuple_images.append((src, img.get("alt", cls.get_name_from_url(src))))
 
         images = await cls.get_images(tuple_images)
         return images
 
     @classmethod
     @tracer.start_as_current_span("fetch_img")
-    async def fetch_img(cls, src: str) -> tuple[str, str] | None:
+    async def fetch_img(
+        cls, client: httpx.AsyncClient, src: str
+    ) -> tuple[str, str] | None:
         span = trace.get_current_span()
         span.set_attributes({"image.src": src})
         try:
-            async with httpx.AsyncClient(
-                timeout=3, transport=httpx.AsyncHTTPTransport(retries=3)
-            ) as client:
-                httpx_response = await client.get(src)
-                if httpx_response.is_success:
-                    mimetype = httpx_response.headers.get("Content-Type", "image/jpeg")
-                    base64_data = base64.b64encode(httpx_response.content).decode()
-                    return mimetype, base64_data
+            httpx_response = await client.get(src)
+            if httpx_response.is_success:
+                mimetype = httpx_response.headers.get("Content-Type", "image/jpeg")
+                base64_data = base64.b64encode(httpx_response.content).decode()
+                return mimetype, base64_data
         except Exception as e:
             span.record_exception(e)
         return None
 
     @classmethod
     async def get_images(cls, tuple_images: list[tuple[str, str]]) -> list[Image]:
-        fetched_imgs = await asyncio.gather(
-            *[cls.fetch_img(src) for src, _ in tuple_images]
-        )
+        if not tuple_images:
+            return []
+        # Share one client (one transport and SSL context) across the batch
+        # instead of building one per image.
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(3, pool=None),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+        ) as client:
+            fetched_imgs = await asyncio.gather(
+                *[cls.fetch_img(client, src) for src, _ in tuple_images]
+            )
         images: list[Image] = []
 
         for (src, alt), pair in zip(tuple_images, fetched_imgs):
@@ -17,6 +17,13 @@ logger = logging.getLogger(__name__)
 
 
 class XProcessor(HTMLReaderBaseProcessor):
+    USERNAME_PATTERN: re.Pattern = re.compile(r"@\w+")
+    LEADING_MENTIONS_PATTERN: re.Pattern = re.compile(r"^(?:@\w+\s+)+")
+    TOKEN_PATTERN: re.Pattern = re.compile(r"[\w@]+")
+    SOURCE_LINK_TEXT_PATTERN: re.Pattern = re.compile(r"From\s+\S+")
+    URL_TEXT_PATTERN: re.Pattern = re.compile(r"https?://\S+")
+    CONTINUOUS_BREAK_LINES_PATTERN: re.Pattern = re.compile(r"\n{3,}")
+
     def hit(self, html: str, url: str) -> bool:
         parsed = urlparse(url)
         if parsed.netloc == "x.com":
@@ -91,7 +98,9 @@ class XProcessor(HTMLReaderBaseProcessor):
         if not user_name:
             return ""
 
-        username_match = re.search(r"@[\w]+", user_name.get_text(" ", strip=True))
+        username_match = self.USERNAME_PATTERN.search(
+            user_name.get_text(" ", strip=True)
+        )
         if not username_match:
             return ""
 
@@ -113,7 +122,9 @@ class XProcessor(HTMLReaderBaseProcessor):
 
         user_name = card.find(attrs={"data-testid": "User-Name"})
         if user_name:
-            username_match = re.search(r"@[\w]+", user_name.get_text(" ", strip=True))
+            username_match = self.USERNAME_PATTERN.search(
+                user_name.get_text(" ", strip=True)
+            )
             if username_match:
                 quote_parts.append(username_match.group())
 
@@ -212,7 +223,7 @@ class XProcessor(HTMLReaderBaseProcessor):
             )
             if user_name_div:
                 all_text = user_name_div.get_text()
-                username_match = re.search(r"@[\w]+", all_text)
+                username_match = self.USERNAME_PATTERN.search(all_text)
                 if username_match:
                     username = username_match.group()
                     result_parts.append(username)
@@ -296,7 +307,7 @@ class XProcessor(HTMLReaderBaseProcessor):
                 )
                 if user_name_div:
                     all_text = user_name_div.get_text()
-                    username_match = re.search(r"@[\w]+", all_text)
+                    username_match = self.USERNAME_PATTERN.search(all_text)
                     if username_match:
                         username = username_match.group()
                         result_parts.append(username)
@@ -627,7 +638,9 @@ class XProcessor(HTMLReaderBaseProcessor):
         normalized = self._normalize_restricted_match_text(locator_text)
         variants = [normalized]
 
-        without_leading_mentions = re.sub(r"^(?:@\w+\s+)+", "", normalized).strip()
+        without_leading_mentions = self.LEADING_MENTIONS_PATTERN.sub(
+            "", normalized
+        ).strip()
         if without_leading_mentions and without_leading_mentions != normalized:
             variants.append(without_leading_mentions)
 
@@ -646,8 +659,8 @@ class XProcessor(HTMLReaderBaseProcessor):
 
     # Measures useful word/token overlap between a locator anchor and body text.
     def _restricted_text_overlap_score(self, anchor: str, text: str) -> int:
-        anchor_tokens = set(re.findall(r"[\w@]+", anchor.lower()))
-        text_tokens = set(re.findall(r"[\w@]+", text.lower()))
+        anchor_tokens = set(self.TOKEN_PATTERN.findall(anchor.lower()))
+        text_tokens = set(self.TOKEN_PATTERN.findall(text.lower()))
 
         if not anchor_tokens or not text_tokens:
             return 0
@@ -735,7 +748,7 @@ class XProcessor(HTMLReaderBaseProcessor):
             parts.append(child.get_text("", strip=False))
 
         markdown = "".join(parts)
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = self.CONTINUOUS_BREAK_LINES_PATTERN.sub("\n\n", markdown)
         return markdown.strip()
 
     # Extracts content images near the matched restricted body container.
@@ -923,7 +936,7 @@ class XProcessor(HTMLReaderBaseProcessor):
             link.name == "a"
             and href
             and not self._is_x_internal_url(href)
-            and re.fullmatch(r"From\s+\S+", text)
+            and self.SOURCE_LINK_TEXT_PATTERN.fullmatch(text)
         )
 
     # Finds the primary preview link paired with a restricted external source link.
@@ -1070,7 +1083,7 @@ class XProcessor(HTMLReaderBaseProcessor):
     def _extract_restricted_embedded_post_handle(self, card: Tag) -> str:
         for link in card.find_all("a"):
             text = link.get_text(" ", strip=True)
-            match = re.search(r"@[\w_]+", text)
+            match = self.USERNAME_PATTERN.search(text)
             if match:
                 return match.group()
 
@@ -1084,7 +1097,7 @@ class XProcessor(HTMLReaderBaseProcessor):
             text = self._restricted_container_match_text(tag)
             if not self._is_effective_restricted_text(text):
                 continue
-            if re.fullmatch(r"@[\w_]+", text):
+            if self.USERNAME_PATTERN.fullmatch(text):
                 continue
 
             candidates.append(tag)
@@ -1211,7 +1224,7 @@ class XProcessor(HTMLReaderBaseProcessor):
         if len(text) <= 10:
             return False
 
-        if re.fullmatch(r"https?://\S+", text):
+        if self.URL_TEXT_PATTERN.fullmatch(text):
             return False
 
         blocked_texts = [
@@ -1301,11 +1314,9 @@ class XProcessor(HTMLReaderBaseProcessor):
             markdown = "\n".join(map(lambda x: x.strip(), markdown.split("\n")))
         title = next(
             (
-                line.strip()
+                stripped
                 for line in markdown.split("\n")
-                if line.strip()
-                and not line.strip().startswith("![")
-                and not line.strip().startswith(">")
+                if (stripped := line.strip()) and not stripped.startswith(("![", ">"))
             ),
             None,
         )
@@ -1447,7 +1458,7 @@ class XProcessor(HTMLReaderBaseProcessor):
             author_div = simple_tweet.select_one('[data-testid="User-Name"]')
             if author_div:
                 author_text = author_div.get_text(strip=True)
-                username_match = re.search(r"@[\w]+", author_text)
+                username_match = self.USERNAME_PATTERN.search(author_text)
                 if username_match:
                     quote_parts.append(username_match.group())
 
@@ -1475,7 +1486,7 @@ class XProcessor(HTMLReaderBaseProcessor):
             author_div = simple_tweet.select_one('[data-testid="User-Name"]')
             if author_div:
                 all_text = author_div.get_text()
-                username_match = re.search(r"@[\w]+", all_text)
+                username_match = self.USERNAME_PATTERN.search(all_text)
                 if username_match:
                     username = username_match.group()
                     quote_parts.append(username)
@@ -1,7 +1,6 @@
 from opentelemetry import trace
 
 from common.trace_info import TraceInfo
-from common.utils import json_dumps
 from omnibox_wizard.worker.config import WorkerConfig
 from omnibox_wizard.worker.functions.base_function import BaseFunction
 from wizard_common.worker.entity import Task
@@ -38,7 +37,7 @@ class TagExtractor(BaseFunction):
         )
         span.set_attributes(
             {
-                "extracted_tags": json_dumps(tags_extract_output.tags),
+                "extracted_tags": tags_extract_output.tags,
                 "tags_count": len(tags_extract_output.tags),
             }
         )
@@ -55,11 +55,12 @@ class WebAnalysisFunction(BaseFunction):
         )
 
     def is_video(self, url: str, html: str) -> bool:
-        soup = BeautifulSoup(html, "html.parser")
         if is_xhs(url):
+            soup = BeautifulSoup(html, "html.parser")
             element = soup.find(attrs={"data-type": True})
             return element.get("data-type") == "video" if element else False
         if is_douyin(url):
+            soup = BeautifulSoup(html, "html.parser")
             if feed_active := soup.find(attrs={"data-e2e": "feed-active-video"}):
                 return any(
                     "hideXgVideo" not in c.get("class", "")
@@ -72,6 +73,7 @@ class WebAnalysisFunction(BaseFunction):
                 return False
             if "/video/" in parsed.path:
                 return True
+            soup = BeautifulSoup(html, "html.parser")
             active_slide = soup.find(attrs={"class": "swiper-slide-active"})
             if active_slide:
                 active_html = str(active_slide)
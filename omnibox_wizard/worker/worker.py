@@ -279,7 +279,12 @@ class Worker:
             task.output = output
             task.status = "finished"
             span.set_status(Status(StatusCode.OK))
-            span.set_attribute("task.output_size", len(str(output)) if output else 0)
+            # str(output) can be many MB (markdown plus base64 images), so only
+            # build it when the span is actually sampled.
+            if span.is_recording():
+                span.set_attribute(
+                    "task.output_size", len(str(output)) if output else 0
+                )
 
         except asyncio.TimeoutError:
             # Handle timeout - calculate actual timeout used
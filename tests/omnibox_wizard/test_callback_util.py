@@ -0,0 +1,18 @@
+import httpx
+
+from omnibox_wizard.worker.callback_util import CallbackUtil
+
+
+def test_should_upload_to_s3_measures_the_sent_body():
+    payload = {
+        "id": "test",
+        "output": {"markdown": "日本語 " * 100, "tags": ["a", "b"]},
+    }
+    body_size = len(httpx.Request("POST", "http://backend", json=payload).content)
+
+    callback_util = object.__new__(CallbackUtil)
+    callback_util.payload_size_threshold = body_size
+    assert not callback_util._should_upload_to_s3(payload)
+
+    callback_util.payload_size_threshold = body_size - 1
+    assert callback_util._should_upload_to_s3(payload)